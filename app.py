@@ -10,6 +10,7 @@ from sentence_transformers import SentenceTransformer
 from config import VERIFY_TOKEN, OPENAI_API_KEY, MODEL_NAME, PERSIST_DIRECTORY, COLLECTION_NAME
 from whatsapp_handler import WhatsAppHandler
 from database import add_new_customer
+from maintenance import MaintenanceScheduler
 # يجب نسخ ولصق الكلاسات من ملفك الأصلي هنا أو استيرادها من bot_logic.py
 # للتبسيط، سأفترض أننا سنضعها في bot_logic.py ونستوردها
 # from bot_logic import CustomerMemoryManager, ConversationManager, QuickResponseSystem, SmartResponseGenerator, EnhancedRetriever
@@ -31,6 +32,13 @@ app = Flask(__name__)
 # ...
 # ... الخ
 
+# --- مهام الصيانة في الخلفية ---
+maintenance = MaintenanceScheduler()
+# maintenance.add_job("customer_cache", customer_memory.cleanup_old_cache, interval=600)
+# maintenance.add_job("conversations", conversation_manager.cleanup_old_conversations, interval=300)
+# maintenance.add_job("rate_limit", whatsapp_handler.cleanup_rate_limit, interval=120)
+maintenance.start()
+
 # --- مسارات API للبوت ---
 @app.route('/webhook', methods=['GET', 'POST'])
 def webhook():
@@ -1,6 +1,7 @@
 # bot_logic.py
 import threading
 import random
+import heapq
 from datetime import datetime, timedelta
 from database import get_customer_details_from_db
 
@@ -91,22 +92,37 @@ class CustomerMemoryManager:
         
         return summary
 
-    def cleanup_old_cache(self):
-        """تنظيف الذاكرة من العملاء القدامى"""
+    def cleanup_old_cache(self) -> int:
+        """تنظيف الذاكرة من العملاء القدامى، وإرجاع عدد العناصر المحذوفة"""
         with self.memory_lock:
             if len(self.customer_cache) > 50:
                 keys_to_remove = list(self.customer_cache.keys())[:25]
                 for key in keys_to_remove:
                     del self.customer_cache[key]
                 print("🧹 تم تنظيف ذاكرة العملاء المؤقتة (Cache)")
+                return len(keys_to_remove)
+            return 0
+
+    def clear_conversation_history(self, phone_numbers) -> int:
+        """حذف تاريخ المحادثة لأرقام انتهت محادثاتها"""
+        with self.memory_lock:
+            removed = 0
+            for phone in phone_numbers:
+                if self.conversation_history.pop(phone, None) is not None:
+                    removed += 1
+            return removed
 
 # --- 🚀 نظام ذاكرة محادثات محسّن ---
 class ConversationManager:
-    # ... هذا الكلاس صحيح، لا حاجة لتعديله
-    def __init__(self, customer_memory):
+    # انتهاء المحادثات يُتتبع في heap مرتب حسب وقت الانتهاء،
+    # فيكون التنظيف بحجم المحادثات المنتهية فقط وليس كل المحادثات
+    def __init__(self, customer_memory, ttl: timedelta = timedelta(hours=24)):
         self.conversations = {}
         self.message_lock = threading.Lock()
         self.customer_memory = customer_memory
+        self.ttl = ttl
+        self._expiry_heap = []  # (وقت الانتهاء, الرقم)
+        self._scheduled_expiry = {}  # الرقم -> وقت الانتهاء الفعلي في الـ heap
         
     def is_first_message(self, phone_number: str) -> bool:
         with self.message_lock:
@@ -115,26 +131,52 @@ class ConversationManager:
     def register_conversation(self, phone_number: str):
         with self.message_lock:
             customer_info = self.customer_memory.get_customer_info(phone_number)
+            now = datetime.now()
             self.conversations[phone_number] = {
-                'last_activity': datetime.now(),
+                'last_activity': now,
                 'is_existing_customer': customer_info is not None,
                 'customer_name': customer_info.get('name', '') if customer_info else ''
             }
+            if phone_number not in self._scheduled_expiry:
+                self._schedule_expiry(phone_number, now + self.ttl)
     
     def update_activity(self, phone_number: str):
+        # لا نلمس الـ heap هنا: الموعد القديم يُعاد جدولته عند خروجه من الـ heap
         with self.message_lock:
             if phone_number in self.conversations:
                 self.conversations[phone_number]['last_activity'] = datetime.now()
     
-    def cleanup_old_conversations(self):
-        cutoff_time = datetime.now() - timedelta(hours=24)
+    def _schedule_expiry(self, phone_number: str, expires_at: datetime):
+        """يجب استدعاؤها مع message_lock"""
+        self._scheduled_expiry[phone_number] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, phone_number))
+    
+    def cleanup_old_conversations(self) -> int:
+        """حذف المحادثات المنتهية، وإرجاع عدد العناصر المحذوفة"""
+        now = datetime.now()
+        expired = []
         with self.message_lock:
-            expired = [phone for phone, data in self.conversations.items() 
-                      if data['last_activity'] < cutoff_time]
-            for phone in expired:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, phone = heapq.heappop(self._expiry_heap)
+                if self._scheduled_expiry.get(phone) != expires_at:
+                    continue  # موعد قديم تم استبداله
+                del self._scheduled_expiry[phone]
+                data = self.conversations.get(phone)
+                if data is None:
+                    continue
+                actual_expiry = data['last_activity'] + self.ttl
+                if actual_expiry > now:
+                    # المحادثة نشطة منذ الجدولة، نؤجل موعد انتهائها
+                    self._schedule_expiry(phone, actual_expiry)
+                    continue
                 del self.conversations[phone]
-            if expired:
-                print(f"🧹 تم تنظيف {len(expired)} محادثة قديمة")
+                expired.append(phone)
+        
+        removed = len(expired)
+        if expired:
+            removed += self.customer_memory.clear_conversation_history(expired)
+            print(f"🧹 تم تنظيف {len(expired)} محادثة قديمة")
+        return removed
 
 # --- ⚡ نظام الردود السريعة المطور ---
 class QuickResponseSystem:
@@ -0,0 +1,64 @@
+# maintenance.py
+import threading
+import heapq
+import time
+
+# --- 🧹 جدولة مهام الصيانة في الخلفية ---
+class MaintenanceScheduler:
+    """خيط واحد في الخلفية يشغّل مهام التنظيف كل فترة محددة.
+
+    كل مهمة دالة بدون وسائط ترجع عدد العناصر التي حذفتها من الذاكرة.
+    """
+    def __init__(self):
+        self.jobs = []  # heap: (موعد التشغيل القادم, الاسم, الفترة بالثواني, الدالة)
+        self.stats = {}  # الاسم -> إجمالي العناصر المحذوفة
+        self.jobs_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def add_job(self, name: str, func, interval: float):
+        with self.jobs_lock:
+            heapq.heappush(self.jobs, (time.monotonic() + interval, name, interval, func))
+            self.stats.setdefault(name, 0)
+        self._wakeup.set()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="maintenance-scheduler", daemon=True)
+        self._thread.start()
+        print("🕒 تم تشغيل جدولة مهام الصيانة")
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            with self.jobs_lock:
+                delay = self.jobs[0][0] - time.monotonic() if self.jobs else None
+            if delay is None or delay > 0:
+                self._wakeup.wait(delay)
+                self._wakeup.clear()
+                continue
+
+            with self.jobs_lock:
+                _, name, interval, func = heapq.heappop(self.jobs)
+            self._run_job(name, func)
+            with self.jobs_lock:
+                heapq.heappush(self.jobs, (time.monotonic() + interval, name, interval, func))
+
+    def _run_job(self, name: str, func):
+        try:
+            reclaimed = func() or 0
+        except Exception as e:
+            print(f"❌ خطأ في مهمة الصيانة {name}: {e}")
+            return
+        with self.jobs_lock:
+            self.stats[name] += reclaimed
+        if reclaimed:
+            print(f"♻️ مهمة {name}: تم تحرير {reclaimed} عنصر من الذاكرة (الإجمالي {self.stats[name]})")
@@ -24,6 +24,14 @@ class WhatsAppHandler:
         self.rate_limit[phone_number] = now
         return False
 
+    def cleanup_rate_limit(self, max_age: float = 60.0) -> int:
+        """حذف سجلات الـ rate limit القديمة، وإرجاع عدد العناصر المحذوفة"""
+        cutoff = time.time() - max_age
+        stale = [phone for phone, last_seen in list(self.rate_limit.items()) if last_seen < cutoff]
+        for phone in stale:
+            self.rate_limit.pop(phone, None)
+        return len(stale)
+
     def send_message(self, to_number: str, message: str) -> bool:
         if not ACCESS_TOKEN or not PHONE_NUMBER_ID:
             print("❌ معلومات WhatsApp غير مكتملة")